@@ -1,38 +1,151 @@
 import os
 import csv
+import re
+import itertools
+import threading
+import time
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from googleapiclient.discovery import build
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QDateEdit, QSpinBox, QFileDialog, QTextEdit, QCheckBox,
-    QMessageBox, QScrollArea
+    QMessageBox, QListView, QStyledItemDelegate, QStyleOptionViewItem,
+    QStyleOptionButton, QStyle
 )
-from PyQt6.QtCore import QDate, Qt
+from PyQt6.QtCore import (
+    QDate, Qt, QAbstractListModel, QModelIndex, QRect, QSize, QEvent, QObject, QRunnable,
+    QThreadPool, pyqtSignal
+)
+from PyQt6.QtGui import QPalette
 from youtubesearchpython import VideosSearch
 from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import _api as transcript_api_module
 import webbrowser
 
 # Load environment variables
 load_dotenv()
 
+# requests never falls back to the socket default timeout, so transcript fetches get an
+# explicit one and a single retry without back-off
+TRANSCRIPT_TIMEOUT = 3
+
+
+class TranscriptSession(requests.Session):
+    def __init__(self):
+        super().__init__()
+        adapter = HTTPAdapter(max_retries=Retry(total=1, backoff_factor=0))
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = TRANSCRIPT_TIMEOUT
+        return super().request(method, url, **kwargs)
+
+
+class _TranscriptRequests:
+    Session = TranscriptSession
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+# youtube_transcript_api >= 1.0 takes the session as http_client; the 0.6.x static API
+# builds its own requests.Session() inside _api, so point that module at ours instead
+TRANSCRIPT_API_ACCEPTS_SESSION = hasattr(YouTubeTranscriptApi, 'fetch')
+if not TRANSCRIPT_API_ACCEPTS_SESSION:
+    transcript_api_module.requests = _TranscriptRequests()
+
+
+def get_transcript(video_id):
+    if TRANSCRIPT_API_ACCEPTS_SESSION:
+        with TranscriptSession() as session:
+            return YouTubeTranscriptApi(http_client=session).fetch(video_id).to_raw_data()
+    return YouTubeTranscriptApi.get_transcript(video_id)
+
+
 # Get API key from environment variable
 api_key = os.getenv("YOUTUBE_API_KEY")
 
-# Initialize the YouTube API client
+# Initialize the YouTube API client. Every request shares the client's single httplib2.Http,
+# which is not thread-safe, so executions from worker threads are serialized.
 youtube = None
+youtube_http_lock = threading.Lock()
 if api_key:
     youtube = build('youtube', 'v3', developerKey=api_key)
 
 
-def search_videos_with_api(query, max_results=50):
-    request = youtube.search().list(
+def execute_request(request):
+    with youtube_http_lock:
+        return request.execute()
+
+
+@dataclass(slots=True)
+class VideoRow:
+    title: str
+    channel: str
+    views: int | None
+    published: str
+    video_id: str
+    published_at: datetime
+
+
+def _parse_view_count(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_views_text(text):
+    # Scraped counts look like '1,234,567 views'
+    digits = re.sub(r'\D', '', text or '')
+    return int(digits) if digits else None
+
+
+def normalize_video(video, use_api, now):
+    if use_api:
+        snippet = video['snippet']
+        return VideoRow(
+            title=snippet['title'],
+            channel=snippet['channelTitle'],
+            views=_parse_view_count(video.get('statistics', {}).get('viewCount')),
+            published=snippet['publishedAt'],
+            video_id=video['id'],
+            published_at=_parse_iso(snippet['publishedAt'])
+        )
+    return VideoRow(
+        title=video.get('title', 'N/A'),
+        channel=video.get('channel', {}).get('name', 'N/A'),
+        views=_parse_views_text(video.get('viewCount', {}).get('text')),
+        published=video.get('publishedTime', 'N/A'),
+        video_id=video.get('id', 'N/A'),
+        published_at=parse_relative_time(video.get('publishedTime', ''), now)
+    )
+
+
+def search_videos_with_api(query, max_results=50, published_after=None, published_before=None):
+    params = dict(
         q=query,
         type='video',
-        part='id,snippet',
+        part='id',
+        fields='items(id/videoId)',
         maxResults=max_results
     )
-    response = request.execute()
+    # Let the API apply the date range so the follow-up videos.list call only covers relevant ids
+    if published_after:
+        params['publishedAfter'] = published_after.strftime('%Y-%m-%dT%H:%M:%SZ')
+    if published_before:
+        params['publishedBefore'] = published_before.strftime('%Y-%m-%dT%H:%M:%SZ')
+    request = youtube.search().list(**params)
+    response = execute_request(request)
     return response['items']
 
 
@@ -48,85 +161,278 @@ def search_videos_without_api(query, max_results=50):
         return []
 
 
-def get_video_details(video_ids):
+# videos.list responses, keyed by video id, reused while still fresh
+VIDEO_DETAILS_TTL = 300
+VIDEO_DETAILS_CACHE_SIZE = 2048
+_video_details_cache = {}
+
+
+def _fetch_video_details(video_ids):
     request = youtube.videos().list(
         part='snippet,statistics',
+        fields='items(id,snippet(title,channelTitle,publishedAt),statistics(viewCount))',
         id=','.join(video_ids)
     )
-    response = request.execute()
+    response = execute_request(request)
     return response['items']
 
 
-def parse_relative_time(time_str):
+def get_video_details(video_ids):
+    if not video_ids:
+        return []
+
+    now = time.monotonic()
+    missing_ids = [vid for vid in video_ids
+                   if vid not in _video_details_cache or now - _video_details_cache[vid][0] > VIDEO_DETAILS_TTL]
+    if missing_ids:
+        for item in _fetch_video_details(missing_ids):
+            _video_details_cache.pop(item['id'], None)
+            _video_details_cache[item['id']] = (now, item)
+        # Dicts keep insertion order, so the oldest entries are evicted first
+        while len(_video_details_cache) > VIDEO_DETAILS_CACHE_SIZE:
+            del _video_details_cache[next(iter(_video_details_cache))]
+
+    return [_video_details_cache[vid][1] for vid in video_ids if vid in _video_details_cache]
+
+
+_RELATIVE_TIME_RE = re.compile(r'(\d+)\s+(hour|day|week|month|year)', re.IGNORECASE)
+_RELATIVE_TIME_UNITS = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365),
+}
+
+
+@lru_cache(maxsize=256)
+def parse_relative_time(time_str, now):
     if not time_str or 'Streamed' in time_str:
-        return datetime.now()
+        return now
+
+    match = _RELATIVE_TIME_RE.match(time_str)
+    if not match:
+        return now
+
+    value, unit = match.groups()
+    return now - int(value) * _RELATIVE_TIME_UNITS[unit.lower()]
 
-    current_time = datetime.now()
-    time_parts = time_str.split()
 
-    if len(time_parts) < 2:
-        return current_time
+@lru_cache(maxsize=1024)
+def _parse_iso(timestamp):
+    # API timestamps look like '2024-01-31T12:00:00Z'; fromisoformat is much faster than strptime
+    return datetime.fromisoformat(timestamp.rstrip('Z'))
+
+
+def filter_videos_by_date_range(rows, start_date, end_date):
+    return [row for row in rows if start_date <= row.published_at <= end_date]
+
+
+def search_videos(query, max_results, start_date, end_date, use_api):
+    # Fixed reference time so relative strings resolve consistently and hit the cache
+    now = datetime.now()
+    if use_api and youtube:
+        search_results = search_videos_with_api(query, max_results, start_date, end_date)
+        video_ids = [item['id']['videoId'] for item in search_results]
+        video_details = get_video_details(video_ids)
+        rows = [normalize_video(video, True, now) for video in video_details]
+    else:
+        search_results = search_videos_without_api(query, max_results)
+        if not search_results:
+            raise ValueError("No results found")
+        rows = [normalize_video(video, False, now) for video in search_results]
+    return filter_videos_by_date_range(rows, start_date, end_date)
 
+
+def format_transcript(transcript):
+    return "\n".join([f"{entry['start']:.2f} - {entry['text']}" for entry in transcript])
+
+
+def save_transcript(directory, video_id, transcript_text):
+    file_path = os.path.join(directory, f'{video_id}_transcript.txt')
+    # Encode once and hand the whole buffer to an unbuffered binary file, skipping
+    # the text layer's per-chunk encoding and newline translation
+    data = memoryview(transcript_text.encode('utf-8'))
+    with open(file_path, 'wb', buffering=0) as f:
+        while data:
+            data = data[f.write(data):]
+    return file_path
+
+
+def transcribe_video(video_id, directory):
+    transcript_text = format_transcript(get_transcript(video_id))
+    return video_id, transcript_text, save_transcript(directory, video_id, transcript_text)
+
+
+def _try_transcribe_video(video_id, directory):
     try:
-        value = int(time_parts[0])
-        unit = time_parts[1].lower()
-
-        if 'hour' in unit:
-            return current_time - timedelta(hours=value)
-        elif 'day' in unit:
-            return current_time - timedelta(days=value)
-        elif 'week' in unit:
-            return current_time - timedelta(weeks=value)
-        elif 'month' in unit:
-            return current_time - timedelta(days=value * 30)
-        elif 'year' in unit:
-            return current_time - timedelta(days=value * 365)
-        else:
-            return current_time
-    except ValueError:
-        return current_time
+        transcribe_video(video_id, directory)
+        return None
+    except Exception as e:
+        return str(e)
 
 
-def filter_videos_by_date_range(videos, start_date, end_date, use_api):
-    filtered_videos = []
-    for video in videos:
-        if use_api:
-            publish_date = datetime.strptime(video['snippet']['publishedAt'], '%Y-%m-%dT%H:%M:%SZ')
-        else:
-            publish_date = parse_relative_time(video.get('publishedTime', ''))
-        if start_date <= publish_date <= end_date:
-            filtered_videos.append(video)
-    return filtered_videos
+def transcribe_videos(video_ids, directory, max_workers=8):
+    # Each worker fetches and saves its own transcript, so disk writes overlap the
+    # network fetches still in flight instead of running serially afterwards
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        errors = list(executor.map(partial(_try_transcribe_video, directory=directory), video_ids))
+    failed = [(video_id, error) for video_id, error in zip(video_ids, errors) if error is not None]
+    return len(video_ids) - len(failed), failed
 
 
-def export_to_csv(videos, filename, use_api):
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+EXPORT_CHUNK_SIZE = 1000
+
+
+def export_to_csv(rows, filename, progress=None):
+    written = 0
+    records = ((r.title, r.channel, 'N/A' if r.views is None else r.views, r.published, r.video_id)
+               for r in rows)
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(['Title', 'Channel', 'View Count', 'Publish Date', 'Video ID'])
+        while chunk := list(itertools.islice(records, EXPORT_CHUNK_SIZE)):
+            writer.writerows(chunk)
+            written += len(chunk)
+            if progress:
+                progress(written)
+    return written
+
+
+class VideoListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.texts = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.texts[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self.rows[index.row()]
+        return None
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = list(rows)
+        # Build display text once; data() is called on every paint and size query
+        self.texts = [
+            f"Title: {row.title}\n"
+            f"Channel: {row.channel}\n"
+            f"Views: {'N/A' if row.views is None else f'{row.views:,}'}\n"
+            f"Published: {row.published}\n"
+            f"Video ID: {row.video_id}"
+            for row in self.rows
+        ]
+        self.endResetModel()
+
+
+class WorkerSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int)
+
+
+# Runs a blocking call on the global thread pool and reports back through queued signals
+class BackgroundTask(QRunnable):
+    def __init__(self, fn, *args, reports_progress=False):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.reports_progress = reports_progress
+        self.signals = WorkerSignals()
 
-        for video in videos:
-            if use_api:
-                writer.writerow([
-                    video['snippet']['title'],
-                    video['snippet']['channelTitle'],
-                    video['statistics'].get('viewCount', 'N/A'),
-                    video['snippet']['publishedAt'],
-                    video['id']
-                ])
-            else:
-                writer.writerow([
-                    video.get('title', 'N/A'),
-                    video.get('channel', {}).get('name', 'N/A'),
-                    video.get('viewCount', {}).get('text', 'N/A'),
-                    video.get('publishedTime', 'N/A'),
-                    video.get('id', 'N/A')
-                ])
+    def run(self):
+        kwargs = {'progress': self.signals.progress.emit} if self.reports_progress else {}
+        try:
+            result = self.fn(*self.args, **kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class ExportTask(BackgroundTask):
+    def __init__(self, rows, filename):
+        super().__init__(export_to_csv, rows, filename, reports_progress=True)
+
+
+# Paints each result's text and View/Transcribe buttons directly instead of building per-row widgets
+class VideoItemDelegate(QStyledItemDelegate):
+    view_clicked = pyqtSignal(str)
+    transcribe_clicked = pyqtSignal(str)
+
+    PADDING = 8
+    BUTTON_WIDTH = 90
+    BUTTON_HEIGHT = 26
+    TEXT_FLAGS = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap
+
+    def _text_rect(self, rect):
+        p = self.PADDING
+        return rect.adjusted(p, p, -p, -(2 * p + self.BUTTON_HEIGHT))
+
+    def _button_rects(self, rect):
+        p = self.PADDING
+        top = rect.bottom() - p - self.BUTTON_HEIGHT + 1
+        view_rect = QRect(rect.left() + p, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        transcribe_rect = QRect(view_rect.right() + 1 + p, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        return view_rect, transcribe_rect
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        opt.text = ''
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        painter.save()
+        selected = bool(opt.state & QStyle.StateFlag.State_Selected)
+        role = QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text
+        painter.setPen(opt.palette.color(role))
+        painter.drawText(self._text_rect(opt.rect), self.TEXT_FLAGS, text)
+        painter.restore()
+
+        for label, rect in zip(("View", "Transcribe"), self._button_rects(opt.rect)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, opt.widget)
+
+    def sizeHint(self, option, index):
+        p = self.PADDING
+        width = option.widget.viewport().width() if option.widget else 400
+        text_bounds = option.fontMetrics.boundingRect(
+            QRect(0, 0, max(width - 2 * p, 1), 0), self.TEXT_FLAGS, index.data()
+        )
+        return QSize(width, text_bounds.height() + 3 * p + self.BUTTON_HEIGHT)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            pos = event.position().toPoint()
+            video_id = index.data(Qt.ItemDataRole.UserRole).video_id
+            view_rect, transcribe_rect = self._button_rects(option.rect)
+            if view_rect.contains(pos):
+                self.view_clicked.emit(video_id)
+                return True
+            if transcribe_rect.contains(pos):
+                self.transcribe_clicked.emit(video_id)
+                return True
+        return super().editorEvent(event, model, option, index)
 
 
 class YouTubeAnalyzer(QMainWindow):
     def __init__(self):
         super().__init__()
         self.transcript_windows = []
+        self.active_tasks = set()
         self.transcript_directory = os.path.join(os.getcwd(), 'transcripts')
         os.makedirs(self.transcript_directory, exist_ok=True)
         self.initUI()
@@ -173,18 +479,27 @@ class YouTubeAnalyzer(QMainWindow):
         layout.addWidget(self.search_button)
 
         # Results display
-        self.results_area = QScrollArea()
-        self.results_widget = QWidget()
-        self.results_layout = QVBoxLayout(self.results_widget)
-        self.results_area.setWidget(self.results_widget)
-        self.results_area.setWidgetResizable(True)
-        layout.addWidget(self.results_area)
+        self.results_model = VideoListModel(self)
+        self.results_delegate = VideoItemDelegate(self)
+        self.results_delegate.view_clicked.connect(self.view_video)
+        self.results_delegate.transcribe_clicked.connect(self.show_transcript)
+        self.results_view = QListView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setItemDelegate(self.results_delegate)
+        self.results_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.results_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        layout.addWidget(self.results_view)
 
         # Export button
         self.export_button = QPushButton('Export Results to CSV')
         self.export_button.clicked.connect(self.export_results)
         layout.addWidget(self.export_button)
 
+        # Transcribe all button
+        self.transcribe_all_button = QPushButton('Transcribe All Results')
+        self.transcribe_all_button.clicked.connect(self.transcribe_all)
+        layout.addWidget(self.transcribe_all_button)
+
         # Change transcript directory button
         change_dir_button = QPushButton("Change Transcript Directory")
         change_dir_button.clicked.connect(self.change_transcript_directory)
@@ -193,121 +508,114 @@ class YouTubeAnalyzer(QMainWindow):
         self.setWindowTitle('YouTube Analyzer')
         self.setGeometry(100, 100, 800, 600)
 
+    def run_in_background(self, fn, *args, on_finished, on_error):
+        self.start_task(BackgroundTask(fn, *args), on_finished, on_error)
+
+    def start_task(self, task, on_finished, on_error):
+        task.signals.finished.connect(on_finished)
+        task.signals.error.connect(on_error)
+        # Keep the task (and its signals) alive until it reports back
+        task.signals.finished.connect(partial(self.forget_task, task))
+        task.signals.error.connect(partial(self.forget_task, task))
+        self.active_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def forget_task(self, task, _):
+        self.active_tasks.discard(task)
+
     def search_and_display_videos(self):
         query = self.search_input.text()
         max_results = self.max_results_input.value()
         start_date = datetime.combine(self.start_date.date().toPyDate(), datetime.min.time())
         end_date = datetime.combine(self.end_date.date().toPyDate(), datetime.max.time())
-        self.use_api = self.use_api_checkbox.isChecked()
+        use_api = self.use_api_checkbox.isChecked()
 
-        try:
-            if self.use_api and youtube:
-                search_results = search_videos_with_api(query, max_results)
-                video_ids = [item['id']['videoId'] for item in search_results]
-                video_details = get_video_details(video_ids)
-                filtered_videos = filter_videos_by_date_range(video_details, start_date, end_date, self.use_api)
-            else:
-                search_results = search_videos_without_api(query, max_results)
-                if not search_results:
-                    raise ValueError("No results found")
-                filtered_videos = filter_videos_by_date_range(search_results, start_date, end_date, self.use_api)
-
-            if not filtered_videos:
-                QMessageBox.information(self, "No Results",
-                                        "No results found. Please try a different query or date range.")
-            else:
-                self.video_results = filtered_videos
-                self.display_results(filtered_videos)
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            QMessageBox.warning(self, "Error", f"An error occurred: {str(e)}")
-
-    def display_results(self, videos):
-        # Clear previous results
-        for i in reversed(range(self.results_layout.count())):
-            self.results_layout.itemAt(i).widget().setParent(None)
-
-        for video in videos:
-            if self.use_api:
-                title = video['snippet']['title']
-                channel = video['snippet']['channelTitle']
-                views = video['statistics'].get('viewCount', 'N/A')
-                published = video['snippet']['publishedAt']
-                video_id = video['id']
-            else:
-                title = video.get('title', 'N/A')
-                channel = video.get('channel', {}).get('name', 'N/A')
-                views = video.get('viewCount', {}).get('text', 'N/A')
-                published = video.get('publishedTime', 'N/A')
-                video_id = video.get('id', 'N/A')
-
-            result_text = f"Title: {title}\n"
-            result_text += f"Channel: {channel}\n"
-            result_text += f"Views: {views}\n"
-            result_text += f"Published: {published}\n"
-            result_text += f"Video ID: {video_id}\n"
-
-            result_widget = QWidget()
-            result_layout = QVBoxLayout(result_widget)
-
-            result_label = QLabel(result_text)
-            result_label.setWordWrap(True)
-            result_layout.addWidget(result_label)
-
-            button_layout = QHBoxLayout()
-            view_button = QPushButton("View")
-            transcribe_button = QPushButton("Transcribe")
-
-            view_button.clicked.connect(lambda _, vid=video_id: self.view_video(vid))
-            transcribe_button.clicked.connect(lambda _, vid=video_id: self.show_transcript(vid))
-
-            button_layout.addWidget(view_button)
-            button_layout.addWidget(transcribe_button)
-            result_layout.addLayout(button_layout)
-
-            self.results_layout.addWidget(result_widget)
+        self.search_button.setEnabled(False)
+        self.run_in_background(search_videos, query, max_results, start_date, end_date, use_api,
+                               on_finished=self.on_search_finished, on_error=self.on_search_error)
+
+    def on_search_finished(self, filtered_videos):
+        self.search_button.setEnabled(True)
+        if not filtered_videos:
+            QMessageBox.information(self, "No Results",
+                                    "No results found. Please try a different query or date range.")
+        else:
+            self.video_results = filtered_videos
+            self.display_results(filtered_videos)
+
+    def on_search_error(self, message):
+        self.search_button.setEnabled(True)
+        print(f"An error occurred: {message}")
+        QMessageBox.warning(self, "Error", f"An error occurred: {message}")
+
+    def display_results(self, rows):
+        self.results_model.set_rows(rows)
 
     def view_video(self, video_id):
         webbrowser.open(f"https://www.youtube.com/watch?v={video_id}")
 
     def show_transcript(self, video_id):
-        try:
-            transcript = YouTubeTranscriptApi.get_transcript(video_id)
-            transcript_text = "\n".join([f"{entry['start']:.2f} - {entry['text']}" for entry in transcript])
-
-            # Save transcript to file
-            file_path = os.path.join(self.transcript_directory, f'{video_id}_transcript.txt')
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(transcript_text)
-
-            # Create and display transcript in a new window
-            transcript_window = QWidget()
-            transcript_window.setWindowTitle(f"Transcript for video {video_id}")
-            transcript_layout = QVBoxLayout()
-            transcript_display = QTextEdit()
-            transcript_display.setPlainText(transcript_text)
-            transcript_display.setReadOnly(True)
-            transcript_layout.addWidget(transcript_display)
-
-            # Add a label to show where the transcript is saved
-            save_label = QLabel(f"Transcript saved to: {file_path}")
-            transcript_layout.addWidget(save_label)
-
-            # Add a button to open the transcript directory
-            open_dir_button = QPushButton("Open Transcript Directory")
-            open_dir_button.clicked.connect(lambda: os.startfile(self.transcript_directory))
-            transcript_layout.addWidget(open_dir_button)
-
-            transcript_window.setLayout(transcript_layout)
-            transcript_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-            transcript_window.setMinimumSize(400, 300)
-
-            self.transcript_windows.append(transcript_window)
-            transcript_window.show()
-
-            QMessageBox.information(self, "Transcript Saved", f"Transcript saved to: {file_path}")
-        except Exception as e:
-            QMessageBox.warning(self, "Transcription Error", f"Could not retrieve or save transcript: {str(e)}")
+        self.run_in_background(transcribe_video, video_id, self.transcript_directory,
+                               on_finished=self.on_transcript_ready, on_error=self.on_transcript_error)
+
+    def on_transcript_ready(self, result):
+        video_id, transcript_text, file_path = result
+
+        # Create and display transcript in a new window
+        transcript_window = QWidget()
+        transcript_window.setWindowTitle(f"Transcript for video {video_id}")
+        transcript_layout = QVBoxLayout()
+        transcript_display = QTextEdit()
+        transcript_display.setPlainText(transcript_text)
+        transcript_display.setReadOnly(True)
+        transcript_layout.addWidget(transcript_display)
+
+        # Add a label to show where the transcript is saved
+        save_label = QLabel(f"Transcript saved to: {file_path}")
+        save_label.setTextFormat(Qt.TextFormat.PlainText)
+        transcript_layout.addWidget(save_label)
+
+        # Add a button to open the transcript directory
+        open_dir_button = QPushButton("Open Transcript Directory")
+        open_dir_button.clicked.connect(self.open_transcript_directory)
+        transcript_layout.addWidget(open_dir_button)
+
+        transcript_window.setLayout(transcript_layout)
+        transcript_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        transcript_window.setMinimumSize(400, 300)
+
+        self.transcript_windows.append(transcript_window)
+        transcript_window.show()
+
+        QMessageBox.information(self, "Transcript Saved", f"Transcript saved to: {file_path}")
+
+    def on_transcript_error(self, message):
+        QMessageBox.warning(self, "Transcription Error", f"Could not retrieve or save transcript: {message}")
+
+    def transcribe_all(self):
+        if not hasattr(self, 'video_results') or not self.video_results:
+            QMessageBox.warning(self, "No Results", "No results to transcribe. Please perform a search first.")
+            return
+
+        video_ids = [row.video_id for row in self.video_results]
+        directory = self.transcript_directory
+        self.transcribe_all_button.setEnabled(False)
+        self.run_in_background(transcribe_videos, video_ids, directory,
+                               on_finished=partial(self.on_transcribe_all_finished, directory=directory),
+                               on_error=self.on_transcribe_all_error)
+
+    def on_transcribe_all_finished(self, result, directory):
+        self.transcribe_all_button.setEnabled(True)
+        saved, failed = result
+        message = f"Saved {saved} transcripts to: {directory}"
+        if failed:
+            message += "\nCould not retrieve or save transcripts for:"
+            message += "".join(f"\n{video_id}: {error}" for video_id, error in failed)
+        QMessageBox.information(self, "Transcripts Saved", message)
+
+    def on_transcribe_all_error(self, message):
+        self.transcribe_all_button.setEnabled(True)
+        QMessageBox.warning(self, "Transcription Error", f"Could not retrieve or save transcripts: {message}")
 
     def export_results(self):
         if not hasattr(self, 'video_results') or not self.video_results:
@@ -316,9 +624,30 @@ class YouTubeAnalyzer(QMainWindow):
 
         file_name, _ = QFileDialog.getSaveFileName(self, "Save CSV File", "", "CSV Files (*.csv)")
         if file_name:
-            export_to_csv(self.video_results, file_name, self.use_api)
-            QMessageBox.information(self, "Export Successful",
-                                    f"Exported {len(self.video_results)} videos to {file_name}")
+            rows = list(self.video_results)
+            task = ExportTask(rows, file_name)
+            task.signals.progress.connect(partial(self.on_export_progress, total=len(rows)))
+            self.export_button.setEnabled(False)
+            self.start_task(task,
+                            on_finished=partial(self.on_export_finished, file_name=file_name),
+                            on_error=self.on_export_error)
+
+    def on_export_progress(self, written, total):
+        self.statusBar().showMessage(f"Exporting... {written}/{total} rows")
+
+    def on_export_finished(self, written, file_name):
+        self.export_button.setEnabled(True)
+        self.statusBar().clearMessage()
+        QMessageBox.information(self, "Export Successful",
+                                f"Exported {written} videos to {file_name}")
+
+    def on_export_error(self, message):
+        self.export_button.setEnabled(True)
+        self.statusBar().clearMessage()
+        QMessageBox.warning(self, "Export Error", f"Could not export results: {message}")
+
+    def open_transcript_directory(self):
+        os.startfile(self.transcript_directory)
 
     def change_transcript_directory(self):
         new_directory = QFileDialog.getExistingDirectory(self, "Select Transcript Directory")